@@ -4,22 +4,41 @@ Focus Timer CLI - A Pomodoro-style focus timer with session logging.
 """
 
 import argparse
+import atexit
 import csv
+import functools
 import json
 import os
+import queue
 import sys
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-
-from colorama import init, Fore, Style
-
-# Initialize colorama
-init(autoreset=True)
-
-# Import sounds module
+from types import MappingProxyType
+
+from colorama import init
+
+# stats provides Fore/Style, blanked when stdout is not a terminal
+from stats import (
+    Fore,
+    Style,
+    iter_sessions,
+    migrate_legacy_sessions,
+    parse_session_time,
+    show_full_stats,
+    show_history,
+    show_quick_stats,
+)
+
+# Initialize colorama on a terminal only; piped output has no color codes to
+# translate, so skip wrapping every write in colorama's stream proxy
+if sys.stdout.isatty():
+    init(autoreset=True)
+
+# Import sounds module (numpy/pygame are only loaded once a sound is played)
 try:
-    from sounds import play_ambient, stop_ambient, is_playing, get_player, get_sound_icon
+    from sounds import play_ambient, stop_ambient, is_playing, get_player, get_sound_icon, audio_available
     SOUNDS_AVAILABLE = True
 except ImportError:
     SOUNDS_AVAILABLE = False
@@ -27,7 +46,13 @@ except ImportError:
 # Constants
 DATA_DIR = Path(__file__).parent.parent / "data"
 CONFIG_PATH = Path(__file__).parent.parent / "config.json"
-SESSIONS_FILE = DATA_DIR / "sessions.json"
+SESSIONS_FILE = DATA_DIR / "sessions.jsonl"
+
+# Static parts of the per-second countdown line; only the time changes each tick
+_FOCUS_PREFIX = f"\r{Fore.WHITE}⏱️  Time remaining: {Fore.YELLOW}"
+_FOCUS_SUFFIX = f"{Style.RESET_ALL}  "
+_BREAK_PREFIX = f"\r{Fore.WHITE}⏱️  Break time remaining: {Fore.BLUE}"
+_BREAK_SUFFIX = f"{Style.RESET_ALL}  "
 
 DEFAULT_CONFIG = {
     "default_duration": 25,
@@ -47,56 +72,161 @@ def ensure_data_dir():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration or create default."""
+    """Load configuration or create default (cached for the process lifetime).
+    
+    The merged config is shared by every caller, so it is returned read-only;
+    copy it with dict() before changing settings.
+    """
     if CONFIG_PATH.exists():
         with open(CONFIG_PATH, "r") as f:
-            return {**DEFAULT_CONFIG, **json.load(f)}
-    return DEFAULT_CONFIG.copy()
+            return MappingProxyType({**DEFAULT_CONFIG, **json.load(f)})
+    return MappingProxyType(DEFAULT_CONFIG)
 
 
 def save_config(config):
     """Save configuration to file."""
     with open(CONFIG_PATH, "w") as f:
         json.dump(config, f, indent=2)
-
-
-def load_sessions():
-    """Load all sessions from file."""
-    if SESSIONS_FILE.exists():
-        with open(SESSIONS_FILE, "r") as f:
-            return json.load(f)
-    return []
+    load_config.cache_clear()
+
+
+class SessionWriter:
+    """Background appender for the JSON Lines session log."""
+    
+    FLUSH_INTERVAL = 1.0  # seconds between fsyncs while records are pending
+    FSYNC_EVERY = 16      # fsync early once this many records are unsynced
+    
+    def __init__(self, path):
+        self.path = path
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def write(self, session):
+        """Queue a session record for writing without blocking the caller."""
+        self._queue.put(session)
+    
+    def _open(self):
+        """Open the log once and keep the file handle for the process lifetime."""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        return self._file
+    
+    def _run(self):
+        """Drain the queue in batches, syncing at most once per flush interval."""
+        while True:
+            # With nothing left to sync, sleep until the next record arrives
+            timeout = self.FLUSH_INTERVAL if self._unsynced else None
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                try:
+                    self._sync()
+                except Exception as e:
+                    self._error = e
+                continue
+            
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Keep the thread alive on errors; flush() reports them to the caller
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _write_batch(self, batch):
+        """Append a batch of records, syncing if enough are pending."""
+        with self._lock:
+            f = self._open()
+            for session in batch:
+                f.write(json.dumps(session, ensure_ascii=False, separators=(",", ":")) + "\n")
+            # Make the batch visible to readers in this process straight away
+            f.flush()
+            self._unsynced += len(batch)
+        
+        if (self._unsynced >= self.FSYNC_EVERY
+                or time.monotonic() - self._last_sync >= self.FLUSH_INTERVAL):
+            self._sync()
+    
+    def _sync(self):
+        """fsync pending writes to disk."""
+        with self._lock:
+            if self._file is None or not self._unsynced:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+    
+    def flush(self):
+        """Block until every queued session has been written and synced.
+        
+        Re-raises any error the writer thread hit since the last flush.
+        """
+        self._queue.join()
+        self._sync()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
+# Global writer instance
+_session_writer = None
+
+def get_session_writer():
+    """Get or create the global session writer instance."""
+    global _session_writer
+    if _session_writer is None:
+        # Prepare the log here so setup errors surface on the caller's thread
+        ensure_data_dir()
+        migrate_legacy_sessions()
+        _session_writer = SessionWriter(SESSIONS_FILE)
+        atexit.register(_session_writer.flush)
+    return _session_writer
 
 
 def save_session(duration, note="", session_type="focus"):
-    """Save a completed session."""
-    ensure_data_dir()
-    sessions = load_sessions()
-    
+    """Queue a completed session for appending to the JSON Lines log."""
     session = {
         "timestamp": datetime.now().isoformat(),
         "duration": duration,
         "note": note,
         "type": session_type,
     }
-    sessions.append(session)
-    
-    with open(SESSIONS_FILE, "w") as f:
-        json.dump(sessions, f, indent=2)
+    get_session_writer().write(session)
+
+
+@functools.lru_cache(maxsize=1)
+def _playsound_available():
+    """Check once whether playsound is installed."""
+    try:
+        import playsound
+    except ImportError:
+        return False
+    return True
 
 
 def play_notification():
     """Play notification sound or show alert."""
     config = load_config()
     
-    if config.get("sound_enabled"):
-        try:
-            from playsound import playsound
-            # Try to play a system sound or beep
-            print("\a", end="", flush=True)  # Terminal bell
-        except ImportError:
-            pass
+    if config.get("sound_enabled") and _playsound_available():
+        # Try to play a system sound or beep
+        print("\a", end="", flush=True)  # Terminal bell
     
     # Print visual notification
     print(f"\n{Fore.GREEN}{'=' * 50}")
@@ -108,13 +238,9 @@ def play_break_notification():
     """Play break notification sound or show alert."""
     config = load_config()
     
-    if config.get("sound_enabled"):
-        try:
-            from playsound import playsound
-            # Try to play a system sound or beep (different pattern for break)
-            print("\a\a", end="", flush=True)  # Double terminal bell for break
-        except ImportError:
-            pass
+    if config.get("sound_enabled") and _playsound_available():
+        # Try to play a system sound or beep (different pattern for break)
+        print("\a\a", end="", flush=True)  # Double terminal bell for break
     
     # Print visual notification
     print(f"\n{Fore.BLUE}{'=' * 50}")
@@ -122,13 +248,59 @@ def play_break_notification():
     print(f"{Fore.BLUE}{'=' * 50}{Style.RESET_ALL}\n")
 
 
+# Preformatted MM:SS strings for sessions up to an hour
+_TIME_STRS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(3601))
+
+
 def format_time(seconds):
     """Format seconds as MM:SS."""
+    if 0 <= seconds < len(_TIME_STRS):
+        return _TIME_STRS[seconds]
     mins = seconds // 60
     secs = seconds % 60
     return f"{mins:02d}:{secs:02d}"
 
 
+# Pre-encoded copies of _TIME_STRS for building raw countdown frames
+_TIME_BYTES = tuple(t.encode("ascii") for t in _TIME_STRS)
+
+
+def _format_time_bytes(seconds):
+    """Format seconds as MM:SS, returned as ASCII bytes."""
+    if 0 <= seconds < len(_TIME_BYTES):
+        return _TIME_BYTES[seconds]
+    return format_time(seconds).encode("ascii")
+
+
+def _frame_writer(prefix, suffix, duration_seconds):
+    """Return a function that draws the countdown frame for a remaining time.
+    
+    On a terminal every frame is pre-encoded up front and drawn with a
+    single os.write(), bypassing the TextIOWrapper lock and encoder. When
+    stdout is not a TTY, or on Windows where colorama has to translate the
+    ANSI codes, frames go through sys.stdout as before.
+    """
+    if os.name != "nt" and sys.stdout.isatty():
+        encoding = sys.stdout.encoding or "utf-8"
+        prefix_b = prefix.encode(encoding)
+        suffix_b = suffix.encode(encoding)
+        frames = tuple(prefix_b + _format_time_bytes(s) + suffix_b for s in range(duration_seconds + 1))
+        fd = sys.stdout.fileno()
+        # Keep anything already printed ahead of the first raw frame
+        sys.stdout.flush()
+        
+        def draw(remaining):
+            os.write(fd, frames[remaining])
+        return draw
+    
+    def draw(remaining):
+        sys.stdout.write(prefix)
+        sys.stdout.write(format_time(remaining))
+        sys.stdout.write(suffix)
+        sys.stdout.flush()
+    return draw
+
+
 def countdown(duration_minutes, note="", sound_type=None, volume=None):
     """Run the focus timer countdown with optional ambient sound."""
     duration_seconds = duration_minutes * 60
@@ -154,18 +326,23 @@ def countdown(duration_minutes, note="", sound_type=None, volume=None):
         print(f"{Fore.CYAN}Note: {note}")
     if sound_started:
         print(f"{Fore.MAGENTA}🔊  Ambient sound: {sound_icon} {sound_type.replace('-', ' ').title()} (vol: {volume}%)")
-    elif sound_type != "none" and not SOUNDS_AVAILABLE:
+    elif sound_type != "none" and not (SOUNDS_AVAILABLE and audio_available()):
         print(f"{Fore.YELLOW}⚠️  Sound module not available. Install pygame for ambient sounds.")
     print(f"{Fore.YELLOW}Press Ctrl+C to cancel{Style.RESET_ALL}\n")
     
+    saved = False
     try:
-        for remaining in range(duration_seconds, 0, -1):
-            # Build display line with sound indicator
-            sound_indicator = f" {sound_icon}" if sound_icon else ""
-            display = f"\r{Fore.WHITE}⏱️  Time remaining: {Fore.YELLOW}{format_time(remaining)}{sound_indicator}{Style.RESET_ALL}  "
-            sys.stdout.write(display)
-            sys.stdout.flush()
-            time.sleep(1)
+        # Schedule ticks against a monotonic deadline so per-tick work doesn't accumulate drift
+        start = time.monotonic()
+        remaining = duration_seconds
+        # Sound indicator is fixed for the session, so fold it into the suffix once
+        suffix = f" {sound_icon}{_FOCUS_SUFFIX}" if sound_icon else _FOCUS_SUFFIX
+        draw = _frame_writer(_FOCUS_PREFIX, suffix, duration_seconds)
+        while remaining > 0:
+            draw(remaining)
+            # Sleep until the next whole-second boundary
+            time.sleep(max(0.0, start + (duration_seconds - remaining + 1) - time.monotonic()))
+            remaining = duration_seconds - int(time.monotonic() - start)
         
         # Timer complete - stop ambient sound
         if sound_started:
@@ -177,9 +354,10 @@ def countdown(duration_minutes, note="", sound_type=None, volume=None):
         
         play_notification()
         save_session(duration_minutes, note, session_type="focus")
+        saved = True
         
-        # Show stats after session
-        from stats import show_quick_stats
+        # Show stats after session (including the one just queued)
+        get_session_writer().flush()
         show_quick_stats()
         
         # Offer break after focus session
@@ -190,7 +368,11 @@ def countdown(duration_minutes, note="", sound_type=None, volume=None):
         # Stop ambient sound on cancel
         if sound_started:
             stop_ambient()
-        print(f"\n\n{Fore.RED}⚠️  Timer cancelled. Session not saved.{Style.RESET_ALL}")
+        if saved:
+            # Already queued; the exit hook finishes writing it
+            print(f"\n\n{Fore.YELLOW}⚠️  Cancelled. Session saved.{Style.RESET_ALL}")
+        else:
+            print(f"\n\n{Fore.RED}⚠️  Timer cancelled. Session not saved.{Style.RESET_ALL}")
         sys.exit(0)
 
 
@@ -202,12 +384,16 @@ def break_countdown(duration_minutes):
     print(f"{Fore.BLUE}Duration: {duration_minutes} minutes")
     print(f"{Fore.YELLOW}Press Ctrl+C to skip remaining break{Style.RESET_ALL}\n")
     
+    start = time.monotonic()
+    remaining = duration_seconds
     try:
-        for remaining in range(duration_seconds, 0, -1):
+        draw = _frame_writer(_BREAK_PREFIX, _BREAK_SUFFIX, duration_seconds)
+        while remaining > 0:
             # Clear line and print countdown
-            sys.stdout.write(f"\r{Fore.WHITE}⏱️  Break time remaining: {Fore.BLUE}{format_time(remaining)}{Style.RESET_ALL}  ")
-            sys.stdout.flush()
-            time.sleep(1)
+            draw(remaining)
+            # Sleep until the next whole-second boundary
+            time.sleep(max(0.0, start + (duration_seconds - remaining + 1) - time.monotonic()))
+            remaining = duration_seconds - int(time.monotonic() - start)
         
         # Timer complete
         sys.stdout.write(f"\r{Fore.GREEN}⏱️  Break time remaining: 00:00{' ' * 20}{Style.RESET_ALL}\n")
@@ -215,13 +401,16 @@ def break_countdown(duration_minutes):
         
         play_break_notification()
         save_session(duration_minutes, note="Break session", session_type="break")
+        # Surface write errors now rather than from the exit hook
+        get_session_writer().flush()
         
     except KeyboardInterrupt:
         print(f"\n\n{Fore.YELLOW}⚠️  Break skipped early.{Style.RESET_ALL}")
         # Still save partial break
-        elapsed = duration_seconds - remaining if 'remaining' in locals() else 0
+        elapsed = min(duration_seconds, int(time.monotonic() - start))
         if elapsed > 60:  # Only save if at least 1 minute elapsed
             save_session(elapsed // 60, note="Partial break session", session_type="break")
+            get_session_writer().flush()
         return False
     return True
 
@@ -260,7 +449,6 @@ def offer_break():
             elif choice == 'f':
                 # Start next focus session immediately
                 print(f"{Fore.GREEN}Starting next focus session...{Style.RESET_ALL}")
-                config = load_config()
                 default_duration = config.get("default_duration", 25)
                 countdown(default_duration)
                 break
@@ -286,13 +474,11 @@ def cmd_start(args):
 
 def cmd_stats(args):
     """Handle stats command."""
-    from stats import show_full_stats
     show_full_stats()
 
 
 def cmd_history(args):
     """Handle history command."""
-    from stats import show_history
     show_history(limit=args.limit)
 
 
@@ -306,7 +492,7 @@ def cmd_break(args):
 
 def cmd_config(args):
     """Handle config command."""
-    config = load_config()
+    config = dict(load_config())
     
     if args.duration is not None:
         config["default_duration"] = args.duration
@@ -361,46 +547,58 @@ def cmd_config(args):
 
 def cmd_export(args):
     """Handle export command."""
-    sessions = load_sessions()
-    
-    if not sessions:
-        print(f"{Fore.YELLOW}No sessions recorded yet. Nothing to export.{Style.RESET_ALL}")
-        return
-    
     config = load_config()
     
-    # Apply filters
-    filtered_sessions = sessions.copy()
-    
-    # Filter by session type
-    if args.type:
-        filtered_sessions = [s for s in filtered_sessions if s.get("type", "focus") == args.type]
-    
-    # Filter by date range (from)
+    # Parse the date filters up front so they can be applied while streaming
+    from_date = to_date = None
     if args.from_date:
         try:
             from_date = datetime.fromisoformat(args.from_date)
-            filtered_sessions = [s for s in filtered_sessions if datetime.fromisoformat(s["timestamp"]) >= from_date]
         except ValueError:
             print(f"{Fore.RED}Error: Invalid --from date format. Use ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS){Style.RESET_ALL}")
             return
-    
-    # Filter by date range (to)
     if args.to_date:
         try:
             to_date = datetime.fromisoformat(args.to_date)
-            # Include the entire day if only date is provided
-            if to_date.hour == 0 and to_date.minute == 0 and to_date.second == 0:
-                to_date = to_date + timedelta(days=1) - timedelta(seconds=1)
-            filtered_sessions = [s for s in filtered_sessions if datetime.fromisoformat(s["timestamp"]) <= to_date]
         except ValueError:
             print(f"{Fore.RED}Error: Invalid --to date format. Use ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS){Style.RESET_ALL}")
             return
+        # Include the entire day if only date is provided
+        if to_date.hour == 0 and to_date.minute == 0 and to_date.second == 0:
+            to_date = to_date + timedelta(days=1) - timedelta(seconds=1)
+    
+    # Apply filters while streaming the log, so only matching sessions are kept
+    has_sessions = False
+    filtered_sessions = []
+    for session in iter_sessions():
+        has_sessions = True
+        
+        # Filter by session type
+        if args.type and session.get("type", "focus") != args.type:
+            continue
+        
+        # Filter by date range
+        if from_date is not None or to_date is not None:
+            session_time = parse_session_time(session)
+            if from_date is not None and session_time < from_date:
+                continue
+            if to_date is not None and session_time > to_date:
+                continue
+        
+        filtered_sessions.append(session)
+    
+    if not has_sessions:
+        print(f"{Fore.YELLOW}No sessions recorded yet. Nothing to export.{Style.RESET_ALL}")
+        return
     
     if not filtered_sessions:
         print(f"{Fore.YELLOW}No sessions match the specified filters.{Style.RESET_ALL}")
         return
     
+    # The log is append-only and normally already in order; sort anyway so
+    # exports stay chronological after clock changes
+    filtered_sessions.sort(key=lambda s: s["timestamp"])
+    
     # Determine format
     export_format = args.format or config.get("export_format", "json")
     
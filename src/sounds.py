@@ -4,26 +4,103 @@ Ambient focus sounds module for Focus Timer CLI.
 Generates and plays ambient background sounds during focus sessions.
 """
 
-import numpy as np
+import functools
+import math
 import threading
-import time
 from pathlib import Path
 
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+# numpy/pygame are imported on first use (see _load_audio_libs) so that
+# importing this module stays cheap for commands that never play sound
+np = None
+pygame = None
+_fft = None
+_FFT_KWARGS = {}
+_signal = None
+_rng = None
 
 # Sound generation constants
 SAMPLE_RATE = 44100
 BUFFER_SIZE = 1024
 
+# Level for filtered noise: an RMS of 0.2 puts the 0.8 peak at 4 sigma, so the
+# synthesized signal only needs clipping for rare outliers, not a peak search
+_NOISE_RMS = 0.2
+_NOISE_PEAK = 0.8
+
+# Brown noise leaky integrator y[i] = A*y[i-1] + B*x[i]; B gives unit-variance
+# input a stationary output RMS of _NOISE_RMS
+_BROWN_A = 0.997
+_BROWN_B = _NOISE_RMS * math.sqrt(1 - _BROWN_A ** 2)
+
+# Display metadata per sound type
+_SOUND_ICONS = {
+    "white-noise": "🌫️",
+    "rain": "🌧️",
+    "coffee-shop": "☕",
+    "nature": "🌿",
+    "none": "🔇",
+}
+_SOUND_NAMES = {
+    "white-noise": "White Noise",
+    "rain": "Rain",
+    "coffee-shop": "Coffee Shop",
+    "nature": "Nature",
+    "none": "None",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_audio_libs():
+    """Import the audio/numeric stack once. Returns True if sounds can play."""
+    global np, pygame, _fft, _FFT_KWARGS, _signal, _rng
+    try:
+        import numpy as np
+        import pygame
+        import pygame.sndarray
+    except ImportError:
+        return False
+    
+    # scipy.fft is faster and can parallelize transforms; fall back to numpy.fft
+    try:
+        import scipy.fft as _fft
+        _FFT_KWARGS = {"workers": -1}
+    except ImportError:
+        _fft = np.fft
+    
+    # scipy.signal provides the leaky integrator for bounded brown noise
+    try:
+        import scipy.signal as _signal
+    except ImportError:
+        _signal = None
+    
+    # Shared random generator (Generator API supports writing into existing buffers)
+    _rng = np.random.default_rng()
+    return True
+
+
+@functools.lru_cache(maxsize=4)
+def _pink_filter(n):
+    """Return the 1/sqrt(f) spectral filter for an n-sample pink noise chunk."""
+    freqs = np.fft.rfftfreq(n)
+    # Avoid division by zero
+    freqs[0] = 1
+    pink_filter = 1 / np.sqrt(freqs)
+    pink_filter[0] = 1
+    # Fold in the gain that gives uniform(-1, 1) input (variance 1/3) an output
+    # RMS of _NOISE_RMS; irfft output variance is var(x) * sum(|H|^2) / n over
+    # the full (two-sided) spectrum
+    power = (pink_filter[0] ** 2 + 2 * np.sum(pink_filter[1:] ** 2)) / n
+    pink_filter *= _NOISE_RMS / np.sqrt(power / 3)
+    # Shared between calls, so guard against accidental in-place edits
+    pink_filter.flags.writeable = False
+    return pink_filter
+
 
 class AmbientSoundPlayer:
     """Player for ambient focus sounds."""
     
     SOUND_TYPES = ["white-noise", "rain", "coffee-shop", "nature", "none"]
+    LOOP_DURATION = 30  # seconds of sound generated once and looped by pygame
     
     def __init__(self):
         self.current_sound = None
@@ -31,10 +108,13 @@ class AmbientSoundPlayer:
         self.playing = False
         self._thread = None
         self._stop_event = threading.Event()
+        self._cached_sound = None
+        self._cached_sound_type = None
+        self._channel = None
         
     def _init_pygame(self):
         """Initialize pygame mixer if not already initialized."""
-        if not PYGAME_AVAILABLE:
+        if not _load_audio_libs():
             return False
         try:
             if not pygame.mixer.get_init():
@@ -46,45 +126,52 @@ class AmbientSoundPlayer:
     
     def _generate_white_noise(self, duration_sec=5):
         """Generate white noise samples."""
-        samples = np.random.uniform(-1, 1, int(SAMPLE_RATE * duration_sec))
-        return self._convert_to_sound(samples)
+        n = int(SAMPLE_RATE * duration_sec)
+        # White noise needs no filtering, so draw int16 samples directly
+        stereo = np.empty((n, 2), dtype=np.int16)
+        stereo[:, 0] = _rng.integers(-32767, 32767, size=n, dtype=np.int16, endpoint=True)
+        stereo[:, 1] = stereo[:, 0]
+        return pygame.sndarray.make_sound(stereo)
     
     def _generate_brown_noise(self, duration_sec=5):
         """Generate brown noise (deeper, like rain/coffee shop)."""
-        samples = np.random.uniform(-1, 1, int(SAMPLE_RATE * duration_sec))
-        # Apply brown noise filter (integrate with decay)
-        brown = np.cumsum(samples)
-        brown = brown / np.max(np.abs(brown)) * 0.8
-        return self._convert_to_sound(brown)
+        buf = _rng.standard_normal(int(SAMPLE_RATE * duration_sec), dtype=np.float32)
+        if _signal is not None:
+            # Leaky integration has a known stationary level, so no normalize pass
+            brown = _signal.lfilter([_BROWN_B], [1, -_BROWN_A], buf)
+            np.clip(brown, -_NOISE_PEAK, _NOISE_PEAK, out=brown)
+            return self._convert_to_sound(brown)
+        # Without scipy, integrate in place and normalize to the peak
+        np.cumsum(buf, out=buf)
+        buf *= _NOISE_PEAK / max(buf.max(), -buf.min())
+        return self._convert_to_sound(buf)
     
     def _generate_pink_noise(self, duration_sec=5):
         """Generate pink noise (balanced, like nature)."""
-        samples = np.random.uniform(-1, 1, int(SAMPLE_RATE * duration_sec))
-        # Simple pink noise approximation
-        fft = np.fft.rfft(samples)
-        freqs = np.fft.rfftfreq(len(samples))
-        # Avoid division by zero
-        freqs[0] = 1
-        pink_filter = 1 / np.sqrt(freqs)
-        pink_filter[0] = 1
-        filtered = fft * pink_filter
-        pink = np.fft.irfft(filtered, len(samples))
-        pink = pink / np.max(np.abs(pink)) * 0.8
+        n = int(SAMPLE_RATE * duration_sec)
+        samples = _rng.uniform(-1, 1, n)
+        # Simple pink noise approximation: shape the spectrum with a cached filter
+        spectrum = _fft.rfft(samples, **_FFT_KWARGS)
+        spectrum *= _pink_filter(n)
+        pink = _fft.irfft(spectrum, n, **_FFT_KWARGS)
+        # The cached filter already sets the level; just clip rare outliers
+        np.clip(pink, -_NOISE_PEAK, _NOISE_PEAK, out=pink)
         return self._convert_to_sound(pink)
     
     def _convert_to_sound(self, samples):
         """Convert numpy array to pygame Sound object."""
-        # Convert to 16-bit signed integers
-        samples = (samples * 32767).astype(np.int16)
+        stereo = np.empty((len(samples), 2), dtype=np.int16)
+        # Convert to 16-bit signed integers straight into the left channel
+        np.multiply(samples, 32767, out=stereo[:, 0], casting="unsafe")
         # Make stereo
-        stereo = np.column_stack((samples, samples))
-        # Convert to bytes
-        sound_bytes = stereo.tobytes()
-        return pygame.mixer.Sound(buffer=sound_bytes)
+        stereo[:, 1] = stereo[:, 0]
+        # Hand the int16 array to pygame directly (no intermediate bytes copy);
+        # its (n, 2) layout matches the stereo, 16-bit mixer set up in _init_pygame
+        return pygame.sndarray.make_sound(stereo)
     
     def generate_sound(self, sound_type, duration_sec=5):
         """Generate ambient sound of specified type."""
-        if not PYGAME_AVAILABLE:
+        if not _load_audio_libs():
             return None
             
         if sound_type == "white-noise":
@@ -100,7 +187,7 @@ class AmbientSoundPlayer:
     
     def play(self, sound_type, volume=50):
         """Start playing ambient sound in a loop."""
-        if sound_type == "none" or not PYGAME_AVAILABLE:
+        if sound_type == "none":
             return False
             
         if not self._init_pygame():
@@ -117,38 +204,35 @@ class AmbientSoundPlayer:
         return True
     
     def _play_loop(self):
-        """Internal loop for continuous sound playback."""
-        channel = None
-        
-        while not self._stop_event.is_set() and self.playing:
-            try:
-                # Generate a chunk of sound
-                sound = self.generate_sound(self.current_sound, duration_sec=3)
-                if sound is None:
-                    break
-                    
+        """Generate the ambient buffer and start looped playback."""
+        try:
+            # Generate one long buffer per sound type and reuse it across plays
+            if self._cached_sound is None or self._cached_sound_type != self.current_sound:
+                self._cached_sound = self.generate_sound(self.current_sound, duration_sec=self.LOOP_DURATION)
+                self._cached_sound_type = self.current_sound
+            sound = self._cached_sound
+            if sound is None or self._stop_event.is_set():
+                return
+            
+            # Let pygame repeat the buffer in C until stopped; volume lives on
+            # the channel so set_volume() can change it without this thread
+            sound.set_volume(1.0)
+            self._channel = sound.play(loops=-1)
+            if self._channel:
                 # Set volume (0.0 to 1.0)
-                sound.set_volume(self.volume / 100.0)
-                
-                # Play the sound
-                channel = sound.play()
-                if channel:
-                    # Wait for the sound to finish or stop event
-                    while channel.get_busy() and not self._stop_event.is_set():
-                        time.sleep(0.1)
-                else:
-                    time.sleep(0.5)
-                    
-            except Exception as e:
-                # Silently handle audio errors to not disrupt focus
-                time.sleep(1)
+                self._channel.set_volume(self.volume / 100.0)
+        
+        except Exception as e:
+            # Silently handle audio errors to not disrupt focus
+            pass
     
     def stop(self):
         """Stop the ambient sound playback."""
         self.playing = False
         self._stop_event.set()
+        self._channel = None
         
-        if PYGAME_AVAILABLE and pygame.mixer.get_init():
+        if pygame is not None and pygame.mixer.get_init():
             try:
                 pygame.mixer.stop()
             except:
@@ -160,37 +244,20 @@ class AmbientSoundPlayer:
     def set_volume(self, volume):
         """Update volume (0-100)."""
         self.volume = max(0, min(100, volume))
-        # If currently playing, update pygame channel volume
-        if PYGAME_AVAILABLE and pygame.mixer.get_init():
+        # If currently playing, update the ambient loop's channel
+        if self._channel is not None:
             try:
-                for i in range(pygame.mixer.get_num_channels()):
-                    channel = pygame.mixer.Channel(i)
-                    if channel.get_busy():
-                        channel.set_volume(self.volume / 100.0)
+                self._channel.set_volume(self.volume / 100.0)
             except:
                 pass
     
     def get_sound_icon(self):
         """Get emoji icon for current sound type."""
-        icons = {
-            "white-noise": "🌫️",
-            "rain": "🌧️",
-            "coffee-shop": "☕",
-            "nature": "🌿",
-            "none": "🔇",
-        }
-        return icons.get(self.current_sound, "🔇")
+        return _SOUND_ICONS.get(self.current_sound, "🔇")
     
     def get_sound_name(self):
         """Get display name for current sound type."""
-        names = {
-            "white-noise": "White Noise",
-            "rain": "Rain",
-            "coffee-shop": "Coffee Shop",
-            "nature": "Nature",
-            "none": "None",
-        }
-        return names.get(self.current_sound, "None")
+        return _SOUND_NAMES.get(self.current_sound, "None")
 
 
 # Global player instance
@@ -216,6 +283,11 @@ def stop_ambient():
     player.stop()
 
 
+def audio_available():
+    """Check whether numpy and pygame are installed (imports them on first call)."""
+    return _load_audio_libs()
+
+
 def is_playing():
     """Check if ambient sound is currently playing."""
     player = get_player()
@@ -224,6 +296,4 @@ def is_playing():
 
 def get_sound_icon(sound_type):
     """Get icon for a sound type without playing."""
-    player = AmbientSoundPlayer()
-    player.current_sound = sound_type
-    return player.get_sound_icon()
+    return _SOUND_ICONS.get(sound_type, "🔇")
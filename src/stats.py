@@ -3,70 +3,321 @@
 Statistics module for Focus Timer CLI.
 """
 
+import bisect
+import functools
 import json
-from datetime import datetime, timedelta
+import os
+import sys
+from array import array
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 
 from colorama import Fore, Style
 
+# Piped or redirected output gets no color codes, so blank them up front
+# rather than building strings full of escapes nobody will see
+if not sys.stdout.isatty():
+    Fore = SimpleNamespace(**dict.fromkeys(vars(Fore), ""))
+    Style = SimpleNamespace(**dict.fromkeys(vars(Style), ""))
+
+# orjson parses several times faster than the stdlib and reads bytes directly
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 DATA_DIR = Path(__file__).parent.parent / "data"
-SESSIONS_FILE = DATA_DIR / "sessions.json"
+SESSIONS_FILE = DATA_DIR / "sessions.jsonl"
+LEGACY_SESSIONS_FILE = DATA_DIR / "sessions.json"
+
+# ciso8601's C parser is about twice as fast as datetime.fromisoformat on older
+# Pythons; from 3.11 the stdlib parser is comparably fast, so use it there
+if sys.version_info < (3, 11):
+    try:
+        from ciso8601 import parse_datetime as _fromisoformat
+    except ImportError:
+        _fromisoformat = datetime.fromisoformat
+else:
+    _fromisoformat = datetime.fromisoformat
+
+# Column-oriented copy of the session log, rebuilt only when the file's mtime
+# or size changes. Columns share one index and are in timestamp order.
+_cache = {
+    "mtime": None,
+    "size": None,
+    "sessions": [],      # session dicts
+    "ts_str": [],        # raw ISO timestamps
+    "dur": array("i"),   # durations in minutes
+    "typ": [],           # session types ("focus" when missing)
+    "focus_idx": [],     # row indices of focus sessions, ascending
+    "break_idx": [],     # row indices of break sessions, ascending
+    "focus_sessions": [],
+    "np_cols": None,     # numpy versions of the columns, built on demand
+}
+
+# numpy takes ~100 ms to import, which only pays off for large histories
+_NUMPY_MIN_SESSIONS = 20000
+
+# numba's import and JIT compile (cached on disk after the first run) only
+# pay off over numpy's per-window reductions on very large histories
+_NUMBA_MIN_SESSIONS = 200000
+
+# Streak banner flames, capped at five
+_FIRES = ("", "🔥", "🔥🔥", "🔥🔥🔥", "🔥🔥🔥🔥", "🔥🔥🔥🔥🔥")
+
+
+@functools.lru_cache(maxsize=1)
+def migrate_legacy_sessions():
+    """Convert a legacy sessions.json array into the JSON Lines log (one-time).
+    
+    Runs at most once per process, before the session writer opens the log,
+    so the log is never replaced under an open append handle.
+    """
+    if not LEGACY_SESSIONS_FILE.exists():
+        return
+    
+    with open(LEGACY_SESSIONS_FILE, "r", encoding="utf-8") as f:
+        legacy_sessions = json.load(f)
+    legacy = "".join(
+        json.dumps(session, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for session in legacy_sessions
+    )
+    
+    # Legacy sessions predate anything already in the log, so write them
+    # first, unless an interrupted earlier run already got that far
+    existing = SESSIONS_FILE.read_text(encoding="utf-8") if SESSIONS_FILE.exists() else ""
+    if not existing.startswith(legacy):
+        tmp_path = SESSIONS_FILE.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(legacy)
+            f.write(existing)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(SESSIONS_FILE)
+    
+    # Only retire the legacy file once its sessions are safely in the log
+    LEGACY_SESSIONS_FILE.replace(LEGACY_SESSIONS_FILE.with_suffix(".json.bak"))
+
+
+def _load_cache():
+    """Return the cached session columns, rereading the log only if it changed."""
+    migrate_legacy_sessions()
+    try:
+        stat = SESSIONS_FILE.stat()
+        mtime, size = stat.st_mtime_ns, stat.st_size
+    except FileNotFoundError:
+        mtime = size = None
+    if mtime == _cache["mtime"] and size == _cache["size"]:
+        return _cache
+    
+    sessions = []
+    if mtime is not None:
+        with open(SESSIONS_FILE, "rb") as f:
+            sessions = [_loads(line) for line in f if line.strip()]
+        # The log is append-only, so this is normally already sorted (and the
+        # sort is then a single linear check); it only reorders after clock changes
+        sessions.sort(key=lambda s: s["timestamp"])
+    
+    typ = [s.get("type", "focus") for s in sessions]
+    focus_idx = [i for i, t in enumerate(typ) if t == "focus"]
+    _cache.update(
+        mtime=mtime,
+        size=size,
+        sessions=sessions,
+        ts_str=[s["timestamp"] for s in sessions],
+        dur=array("i", [s["duration"] for s in sessions]),
+        typ=typ,
+        # Type partitions shared by the quick and full stats views
+        focus_idx=focus_idx,
+        break_idx=[i for i, t in enumerate(typ) if t == "break"],
+        focus_sessions=[sessions[i] for i in focus_idx],
+        np_cols=None,
+    )
+    return _cache
+
+
+def _numpy_columns(cache):
+    """Return numpy arrays for the cached columns, or None without numpy."""
+    if cache["np_cols"] is None:
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        n = len(cache["typ"])
+        dur = np.frombuffer(cache["dur"], dtype=np.int32).astype(np.int64)
+        # Masks come from the type partitions classified at load time
+        is_focus = np.zeros(n, dtype=bool)
+        is_focus[cache["focus_idx"]] = True
+        is_break = np.zeros(n, dtype=bool)
+        is_break[cache["break_idx"]] = True
+        cache["np_cols"] = {
+            "np": np,
+            "is_focus": is_focus,
+            "is_break": is_break,
+            # Durations zeroed outside each type, so window sums need no masking
+            "focus_dur": dur * is_focus,
+            "break_dur": dur * is_break,
+        }
+    return cache["np_cols"]
+
+
+def _aggregate_kernel(is_focus, is_break, focus_dur, break_dur, starts, out):
+    """Single-pass window aggregation, compiled with numba when available.
+    
+    starts holds the first row of the (today, week, month, all time)
+    windows. Fills out (4x4) with rows focus count, focus minutes, break
+    count, break minutes and columns today, week, month, all time.
+    """
+    focus_count = focus_minutes = break_count = break_minutes = 0
+    end = is_focus.shape[0]
+    for w in range(4):
+        # Windows are nested tails, so each one only adds the rows between
+        # its start and the start of the next narrower window
+        for i in range(starts[w], end):
+            focus_count += is_focus[i]
+            focus_minutes += focus_dur[i]
+            break_count += is_break[i]
+            break_minutes += break_dur[i]
+        out[0, w] = focus_count
+        out[1, w] = focus_minutes
+        out[2, w] = break_count
+        out[3, w] = break_minutes
+        end = starts[w]
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_aggregate():
+    """Return the JIT-compiled _aggregate_kernel, or None without numba."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(_aggregate_kernel)
+
+
+def _aggregate_windows(cache, cutoffs):
+    """Count sessions and sum minutes per type for each time window.
+    
+    cutoffs are the (today, week, month) window starts. Returns
+    (focus_counts, focus_minutes, break_counts, break_minutes), each indexed
+    [today, week, month, all time].
+    """
+    # Rows are in timestamp order, so each window is a tail of the rows
+    starts = [bisect.bisect_left(cache["ts_str"], c.isoformat()) for c in cutoffs]
+    
+    cols = _numpy_columns(cache) if len(cache["typ"]) >= _NUMPY_MIN_SESSIONS else None
+    if cols is not None:
+        # Each window is a tail slice of the columns, and the masks only need
+        # to pick out the session type
+        starts.append(0)
+        
+        kernel = _numba_aggregate() if len(cache["typ"]) >= _NUMBA_MIN_SESSIONS else None
+        if kernel is not None:
+            np = cols["np"]
+            out = np.zeros((4, 4), dtype=np.int64)
+            kernel(cols["is_focus"], cols["is_break"], cols["focus_dur"], cols["break_dur"],
+                   np.asarray(starts, dtype=np.int64), out)
+            return tuple([int(v) for v in row] for row in out)
+        
+        return (
+            [int(cols["is_focus"][i:].sum()) for i in starts],
+            [int(cols["focus_dur"][i:].sum()) for i in starts],
+            [int(cols["is_break"][i:].sum()) for i in starts],
+            [int(cols["break_dur"][i:].sum()) for i in starts],
+        )
+    
+    # Within each type partition a window is a tail of its ascending row
+    # indices, as in show_quick_stats
+    dur = cache["dur"]
+    result = []
+    for idx in (cache["focus_idx"], cache["break_idx"]):
+        firsts = [bisect.bisect_left(idx, start) for start in starts] + [0]
+        counts = [len(idx) - first for first in firsts]
+        # Windows are nested, so sum each stretch between consecutive window
+        # starts once and accumulate from the narrowest window outwards
+        minutes = []
+        total, end = 0, len(idx)
+        for first in firsts:
+            total += sum(dur[idx[j]] for j in range(first, end))
+            minutes.append(total)
+            end = first
+        result += (counts, minutes)
+    return tuple(result)
+
+
+def iter_sessions():
+    """Yield sessions from the log one at a time, in file order.
+    
+    Unlike load_sessions(), nothing is cached or sorted, so callers that
+    filter as they go hold only the sessions they keep.
+    """
+    migrate_legacy_sessions()
+    try:
+        f = open(SESSIONS_FILE, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
 
 
 def load_sessions():
     """Load all sessions from file."""
-    if SESSIONS_FILE.exists():
-        with open(SESSIONS_FILE, "r") as f:
-            return json.load(f)
-    return []
+    # Copy so callers can't reorder or grow the cached list
+    return list(_load_cache()["sessions"])
 
 
 def parse_session_time(session):
     """Parse session timestamp to datetime."""
-    return datetime.fromisoformat(session["timestamp"])
-
+    return _fromisoformat(session["timestamp"])
 
-def get_sessions_in_range(sessions, days=1):
-    """Get sessions from the last N days."""
-    cutoff = datetime.now() - timedelta(days=days)
-    return [s for s in sessions if parse_session_time(s) >= cutoff]
 
-
-def calculate_streak(sessions):
+def calculate_streak(sessions, now=None):
     """Calculate current streak of days with at least one session."""
     if not sessions:
         return 0
+    if now is None:
+        now = datetime.now()
     
-    # Group sessions by date
-    dates_with_sessions = set()
-    for session in sessions:
-        session_date = parse_session_time(session).date()
-        dates_with_sessions.add(session_date)
+    # Group sessions by date; ISO timestamps start with YYYY-MM-DD, so slice
+    # the date off instead of parsing, then convert each distinct day to an
+    # ordinal so the walk below is plain integer arithmetic
+    dates_with_sessions = {
+        date.fromisoformat(day).toordinal()
+        for day in {session["timestamp"][:10] for session in sessions}
+    }
     
     # Calculate streak
     streak = 0
-    today = datetime.now().date()
+    today = now.date().toordinal()
     
     # Check if there's a session today
     if today in dates_with_sessions:
         streak += 1
-    elif today - timedelta(days=1) not in dates_with_sessions:
+    elif today - 1 not in dates_with_sessions:
         # If no session yesterday and none today, streak is 0
         return 0
     
     # Count backwards
-    check_date = today - timedelta(days=1)
-    while check_date in dates_with_sessions:
+    check_day = today - 1
+    while check_day in dates_with_sessions:
         streak += 1
-        check_date -= timedelta(days=1)
+        check_day -= 1
     
     return streak
 
 
+def _plural(n):
+    """Return the plural suffix for a count of n."""
+    return "" if n == 1 else "s"
+
+
+@functools.lru_cache(maxsize=1024)
 def format_duration(minutes):
     """Format minutes as hours and minutes."""
-    hours = minutes // 60
-    mins = minutes % 60
+    hours, mins = divmod(minutes, 60)
     if hours > 0:
         return f"{hours}h {mins}m"
     return f"{mins}m"
@@ -74,144 +325,149 @@ def format_duration(minutes):
 
 def show_quick_stats():
     """Show brief stats after a session."""
-    sessions = load_sessions()
+    cache = _load_cache()
     
-    today_sessions = get_sessions_in_range(sessions, days=1)
-    today_focus_sessions = [s for s in today_sessions if s.get("type", "focus") == "focus"]
-    today_break_sessions = [s for s in today_sessions if s.get("type") == "break"]
+    # Today's rows are the tail of the (sorted) columns; find where each
+    # type's ascending row indices enter that tail
+    now = datetime.now()
+    # Timestamps are naive datetime.isoformat() strings, which sort the same
+    # as the datetimes they encode, so compare strings instead of parsing
+    cutoff = (now - timedelta(days=1)).isoformat()
+    start = bisect.bisect_left(cache["ts_str"], cutoff)
+    dur, focus_idx, break_idx = cache["dur"], cache["focus_idx"], cache["break_idx"]
+    focus_start = bisect.bisect_left(focus_idx, start)
+    break_start = bisect.bisect_left(break_idx, start)
+    # Sum straight off the index lists without materializing the tails
+    today_focus_count = len(focus_idx) - focus_start
+    today_focus_minutes = sum(dur[focus_idx[j]] for j in range(focus_start, len(focus_idx)))
+    today_break_count = len(break_idx) - break_start
+    today_break_minutes = sum(dur[break_idx[j]] for j in range(break_start, len(break_idx)))
     
-    today_focus_minutes = sum(s["duration"] for s in today_focus_sessions)
-    today_break_minutes = sum(s["duration"] for s in today_break_sessions)
-    
-    streak = calculate_streak(sessions)
+    streak = calculate_streak(cache["sessions"], now=now)
     
     print(f"{Fore.CYAN}📊 Today's Stats:{Style.RESET_ALL}")
-    print(f"   Focus sessions: {len(today_focus_sessions)}")
+    print(f"   Focus sessions: {today_focus_count}")
     print(f"   Focus time: {format_duration(today_focus_minutes)}")
-    if today_break_sessions:
+    if today_break_count:
         print(f"   Break time: {format_duration(today_break_minutes)}")
     if streak > 0:
-        print(f"   🔥 Streak: {streak} day{'s' if streak != 1 else ''}")
+        print(f"   🔥 Streak: {streak} day{_plural(streak)}")
     print()
 
 
 def show_full_stats():
     """Show detailed statistics."""
-    sessions = load_sessions()
+    cache = _load_cache()
+    sessions = cache["sessions"]
     
     if not sessions:
         print(f"{Fore.YELLOW}No sessions recorded yet. Start your first focus session!{Style.RESET_ALL}")
         return
     
-    # Separate focus and break sessions
-    focus_sessions = [s for s in sessions if s.get("type", "focus") == "focus"]
-    break_sessions_list = [s for s in sessions if s.get("type") == "break"]
-    
-    # Calculate stats for focus sessions
-    today_focus = [s for s in get_sessions_in_range(focus_sessions, days=1)]
-    week_focus = [s for s in get_sessions_in_range(focus_sessions, days=7)]
-    month_focus = [s for s in get_sessions_in_range(focus_sessions, days=30)]
-    
-    today_break = [s for s in get_sessions_in_range(break_sessions_list, days=1)]
-    week_break = [s for s in get_sessions_in_range(break_sessions_list, days=7)]
-    month_break = [s for s in get_sessions_in_range(break_sessions_list, days=30)]
+    # Window cutoffs for today / this week / this month
+    now = datetime.now()
+    cutoffs = (now - timedelta(days=1), now - timedelta(days=7), now - timedelta(days=30))
     
-    today_focus_minutes = sum(s["duration"] for s in today_focus)
-    week_focus_minutes = sum(s["duration"] for s in week_focus)
-    month_focus_minutes = sum(s["duration"] for s in month_focus)
-    total_focus_minutes = sum(s["duration"] for s in focus_sessions)
+    focus_counts, focus_minutes, break_counts, break_minutes = _aggregate_windows(cache, cutoffs)
+    today_focus_count, week_focus_count, month_focus_count, total_focus_count = focus_counts
+    today_focus_minutes, week_focus_minutes, month_focus_minutes, total_focus_minutes = focus_minutes
+    today_break_count, week_break_count, month_break_count, total_break_count = break_counts
+    today_break_minutes, week_break_minutes, month_break_minutes, total_break_minutes = break_minutes
     
-    today_break_minutes = sum(s["duration"] for s in today_break)
-    week_break_minutes = sum(s["duration"] for s in week_break)
-    month_break_minutes = sum(s["duration"] for s in month_break)
-    total_break_minutes = sum(s["duration"] for s in break_sessions_list)
-    
-    streak = calculate_streak(focus_sessions)
+    streak = calculate_streak(cache["focus_sessions"], now=now)
     
     # Calculate averages
-    avg_focus_session = total_focus_minutes // len(focus_sessions) if focus_sessions else 0
+    avg_focus_session = total_focus_minutes // total_focus_count if total_focus_count else 0
     
-    # Display stats
-    print(f"\n{Fore.CYAN}{'=' * 50}")
-    print(f"{Fore.CYAN}📊  Productivity Statistics")
-    print(f"{Fore.CYAN}{'=' * 50}{Style.RESET_ALL}\n")
+    # Display stats (collected and written at once)
+    out = []
+    out.append(f"\n{Fore.CYAN}{'=' * 50}\n")
+    out.append(f"{Fore.CYAN}📊  Productivity Statistics\n")
+    out.append(f"{Fore.CYAN}{'=' * 50}{Style.RESET_ALL}\n\n")
     
     # Streak
     if streak > 0:
-        fire = "🔥" * min(streak, 5)
-        print(f"{Fore.YELLOW}{fire}  Current Streak: {streak} day{'s' if streak != 1 else ''}{Style.RESET_ALL}\n")
+        out.append(f"{Fore.YELLOW}{_FIRES[min(streak, 5)]}  Current Streak: {streak} day{_plural(streak)}{Style.RESET_ALL}\n\n")
     
     # Focus Time stats
-    print(f"{Fore.GREEN}🍅  Focus Time:{Style.RESET_ALL}")
-    print(f"   Today:     {format_duration(today_focus_minutes):>10}")
-    print(f"   This Week: {format_duration(week_focus_minutes):>10}")
-    print(f"   This Month:{format_duration(month_focus_minutes):>10}")
-    print(f"   All Time:  {format_duration(total_focus_minutes):>10}")
-    print()
+    out.append(f"{Fore.GREEN}🍅  Focus Time:{Style.RESET_ALL}\n")
+    out.append(f"   Today:     {format_duration(today_focus_minutes):>10}\n")
+    out.append(f"   This Week: {format_duration(week_focus_minutes):>10}\n")
+    out.append(f"   This Month:{format_duration(month_focus_minutes):>10}\n")
+    out.append(f"   All Time:  {format_duration(total_focus_minutes):>10}\n")
+    out.append("\n")
     
     # Focus Session stats
-    print(f"{Fore.GREEN}📈  Focus Sessions:{Style.RESET_ALL}")
-    print(f"   Today:     {len(today_focus):>10}")
-    print(f"   This Week: {len(week_focus):>10}")
-    print(f"   This Month:{len(month_focus):>10}")
-    print(f"   All Time:  {len(focus_sessions):>10}")
-    print()
+    out.append(f"{Fore.GREEN}📈  Focus Sessions:{Style.RESET_ALL}\n")
+    out.append(f"   Today:     {today_focus_count:>10}\n")
+    out.append(f"   This Week: {week_focus_count:>10}\n")
+    out.append(f"   This Month:{month_focus_count:>10}\n")
+    out.append(f"   All Time:  {total_focus_count:>10}\n")
+    out.append("\n")
     
     # Break stats (if any exist)
-    if break_sessions_list:
-        print(f"{Fore.BLUE}☕  Break Time:{Style.RESET_ALL}")
-        print(f"   Today:     {format_duration(today_break_minutes):>10}")
-        print(f"   This Week: {format_duration(week_break_minutes):>10}")
-        print(f"   This Month:{format_duration(month_break_minutes):>10}")
-        print(f"   All Time:  {format_duration(total_break_minutes):>10}")
-        print()
+    if total_break_count:
+        out.append(f"{Fore.BLUE}☕  Break Time:{Style.RESET_ALL}\n")
+        out.append(f"   Today:     {format_duration(today_break_minutes):>10}\n")
+        out.append(f"   This Week: {format_duration(week_break_minutes):>10}\n")
+        out.append(f"   This Month:{format_duration(month_break_minutes):>10}\n")
+        out.append(f"   All Time:  {format_duration(total_break_minutes):>10}\n")
+        out.append("\n")
         
-        print(f"{Fore.BLUE}☕  Break Sessions:{Style.RESET_ALL}")
-        print(f"   Today:     {len(today_break):>10}")
-        print(f"   This Week: {len(week_break):>10}")
-        print(f"   This Month:{len(month_break):>10}")
-        print(f"   All Time:  {len(break_sessions_list):>10}")
-        print()
+        out.append(f"{Fore.BLUE}☕  Break Sessions:{Style.RESET_ALL}\n")
+        out.append(f"   Today:     {today_break_count:>10}\n")
+        out.append(f"   This Week: {week_break_count:>10}\n")
+        out.append(f"   This Month:{month_break_count:>10}\n")
+        out.append(f"   All Time:  {total_break_count:>10}\n")
+        out.append("\n")
     
     # Average
-    print(f"{Fore.MAGENTA}📏  Average Focus Session: {format_duration(avg_focus_session)}{Style.RESET_ALL}")
-    print()
+    out.append(f"{Fore.MAGENTA}📏  Average Focus Session: {format_duration(avg_focus_session)}{Style.RESET_ALL}\n")
+    out.append("\n")
+    
+    sys.stdout.write("".join(out))
 
 
 def show_history(limit=10):
     """Show recent session history."""
-    sessions = load_sessions()
+    cache = _load_cache()
+    sessions, types = cache["sessions"], cache["typ"]
     
     if not sessions:
         print(f"{Fore.YELLOW}No sessions recorded yet.{Style.RESET_ALL}")
         return
     
-    # Sort by timestamp (newest first)
-    sorted_sessions = sorted(sessions, key=lambda s: s["timestamp"], reverse=True)
-    recent = sorted_sessions[:limit]
+    # Sessions are cached oldest first, so the newest rows are the tail
+    first = max(len(sessions) - max(limit, 0), 0)
+    recent = range(len(sessions) - 1, first - 1, -1)
     
-    print(f"\n{Fore.CYAN}{'=' * 65}")
-    print(f"{Fore.CYAN}📝  Recent Sessions (last {len(recent)})")
-    print(f"{Fore.CYAN}{'=' * 65}{Style.RESET_ALL}\n")
+    # Collect every line and write them at once
+    out = [
+        f"\n{Fore.CYAN}{'=' * 65}\n",
+        f"{Fore.CYAN}📝  Recent Sessions (last {len(recent)})\n",
+        f"{Fore.CYAN}{'=' * 65}{Style.RESET_ALL}\n\n",
+    ]
     
-    for i, session in enumerate(recent, 1):
-        timestamp = datetime.fromisoformat(session["timestamp"])
-        date_str = timestamp.strftime("%Y-%m-%d %H:%M")
+    for i, row in enumerate(recent, 1):
+        session = sessions[row]
+        # ISO timestamps already hold "YYYY-MM-DD" and "HH:MM" at fixed offsets
+        ts = session["timestamp"]
+        date_str = ts[:10] + " " + ts[11:16]
         duration = session["duration"]
         note = session.get("note", "")
-        session_type = session.get("type", "focus")
+        session_type = types[row]
         
         # Use different colors for focus vs break
         type_color = Fore.GREEN if session_type == "focus" else Fore.BLUE
         type_icon = "🍅" if session_type == "focus" else "☕"
         
-        print(f"{Fore.WHITE}{i:2d}. {type_icon} {type_color}{date_str}{Fore.WHITE} | {Fore.YELLOW}{duration} min{Style.RESET_ALL}", end="")
+        out.append(f"{Fore.WHITE}{i:2d}. {type_icon} {type_color}{date_str}{Fore.WHITE} | {Fore.YELLOW}{duration} min{Style.RESET_ALL}")
         if note:
-            print(f" | {Fore.CYAN}{note}{Style.RESET_ALL}")
-        else:
-            print()
+            out.append(f" | {Fore.CYAN}{note}{Style.RESET_ALL}")
+        out.append("\n")
     
-    print()
+    out.append("\n")
+    sys.stdout.write("".join(out))
 
 
 if __name__ == "__main__":